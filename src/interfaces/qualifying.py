@@ -106,8 +106,7 @@ class QualifyingReplay(arcade.Window):
          self.y_min, self.y_max, self.drs_zones_xy) = build_track_from_example_lap(example_lap.get_telemetry())
          
         ref_points = self._interpolate_points(self.plot_x_ref, self.plot_y_ref, interp_points=4000)
-        self._ref_xs = np.array([p[0] for p in ref_points])
-        self._ref_ys = np.array([p[1] for p in ref_points])
+        self._ref_xs, self._ref_ys = np.ascontiguousarray(ref_points.T)
 
         # cumulative distances along the reference polyline (metres)
         diffs = np.sqrt(np.diff(self._ref_xs)**2 + np.diff(self._ref_ys)**2)
@@ -118,10 +117,20 @@ class QualifyingReplay(arcade.Window):
         # Pre-calculate interpolated world points ONCE (optimization)
         self.world_inner_points = self._interpolate_points(self.x_inner, self.y_inner)
         self.world_outer_points = self._interpolate_points(self.x_outer, self.y_outer)
+        # Packed (N, 2) float32 copies used by the vectorized world -> screen transform
+        self.world_inner_arr = self.world_inner_points.astype(np.float32)
+        self.world_outer_arr = self.world_outer_points.astype(np.float32)
+        # Preallocated screen-space buffers, refilled in place by update_scaling
+        self._screen_inner = np.empty_like(self.world_inner_arr)
+        self._screen_outer = np.empty_like(self.world_outer_arr)
 
-        # These will hold the actual screen coordinates to draw
-        self.screen_inner_points = [self.world_to_screen(x, y) for x, y in self.world_inner_points]
-        self.screen_outer_points = [self.world_to_screen(x, y) for x, y in self.world_outer_points]
+        self._last_size = (0, 0)
+        self._rotated_bounds = self._compute_rotated_bounds()
+        self._update_affine()
+
+        # These will hold the actual screen coordinates to draw (filled by update_scaling)
+        self.screen_inner_points = []
+        self.screen_outer_points = []
 
         # Qualifying segment selector modal
         self.selected_driver = None
@@ -140,32 +149,17 @@ class QualifyingReplay(arcade.Window):
         Recalculates the scale and translation to fit the track 
         perfectly within the new screen dimensions while maintaining aspect ratio.
         """
+        # Resize drags fire many events with the same size; nothing changes for those
+        if (screen_w, screen_h) == self._last_size:
+            return
+        self._last_size = (screen_w, screen_h)
+
         padding = 0.05
-        # If a rotation is applied, we must compute the rotated bounds
         world_cx = (self.x_min + self.x_max) / 2
         world_cy = (self.y_min + self.y_max) / 2
 
-        def _rotate_about_center(x, y):
-            # Translate to centre, rotate, translate back
-            tx = x - world_cx
-            ty = y - world_cy
-            rx = tx * self._cos_rot - ty * self._sin_rot
-            ry = tx * self._sin_rot + ty * self._cos_rot
-            return rx + world_cx, ry + world_cy
-
-        # Build rotated extents from inner/outer world points
-        rotated_points = []
-        for x, y in self.world_inner_points:
-            rotated_points.append(_rotate_about_center(x, y))
-        for x, y in self.world_outer_points:
-            rotated_points.append(_rotate_about_center(x, y))
-
-        xs = [p[0] for p in rotated_points]
-        ys = [p[1] for p in rotated_points]
-        world_x_min = min(xs) if xs else self.x_min
-        world_x_max = max(xs) if xs else self.x_max
-        world_y_min = min(ys) if ys else self.y_min
-        world_y_max = max(ys) if ys else self.y_max
+        # Rotated extents don't depend on the window size (computed once in __init__)
+        world_x_min, world_x_max, world_y_min, world_y_max = self._rotated_bounds
 
         world_w = max(1.0, world_x_max - world_x_min)
         world_h = max(1.0, world_y_max - world_y_min)
@@ -189,10 +183,11 @@ class QualifyingReplay(arcade.Window):
 
         self.tx = screen_cx - self.world_scale * world_cx
         self.ty = screen_cy - self.world_scale * world_cy
+        self._update_affine()
 
-        # Update the polyline screen coordinates based on new scale
-        self.screen_inner_points = [self.world_to_screen(x, y) for x, y in self.world_inner_points]
-        self.screen_outer_points = [self.world_to_screen(x, y) for x, y in self.world_outer_points]
+        # Update the polyline screen coordinates based on new scale (transformed in place, no allocations)
+        self.screen_inner_points = self.world_to_screen_array(self.world_inner_arr, out=self._screen_inner)
+        self.screen_outer_points = self.world_to_screen_array(self.world_outer_arr, out=self._screen_outer)
 
     def on_draw(self):
         self.clear()
@@ -582,8 +577,12 @@ class QualifyingReplay(arcade.Window):
                         return sx, sy
 
                     # Use the interpolated world points if available, fallback to raw arrays
-                    inner_world = getattr(self, "world_inner_points", None) or list(zip(self.x_inner, self.y_inner))
-                    outer_world = getattr(self, "world_outer_points", None) or list(zip(self.x_outer, self.y_outer))
+                    inner_world = getattr(self, "world_inner_points", None)
+                    outer_world = getattr(self, "world_outer_points", None)
+                    if inner_world is None:
+                        inner_world = list(zip(self.x_inner, self.y_inner))
+                    if outer_world is None:
+                        outer_world = list(zip(self.x_outer, self.y_outer))
 
                     self.inner_pts = [world_to_map(x, y) for x, y in inner_world if x is not None and y is not None]
                     self.outer_pts = [world_to_map(x, y) for x, y in outer_world if x is not None and y is not None]
@@ -744,11 +743,17 @@ class QualifyingReplay(arcade.Window):
         self.race_controls_comp.on_resize(self)
 
     def _interpolate_points(self, xs, ys, interp_points=2000):
-        t_old = np.linspace(0, 1, len(xs))
+        """Resample the polyline (xs, ys) to interp_points evenly spaced samples; returns an (N, 2) array."""
+        points = np.column_stack((np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)))
+        if len(points) < 2:
+            return np.repeat(points, interp_points, axis=0)
+        t_old = np.linspace(0, 1, len(points))
         t_new = np.linspace(0, 1, interp_points)
-        xs_i = np.interp(t_new, t_old, xs)
-        ys_i = np.interp(t_new, t_old, ys)
-        return list(zip(xs_i, ys_i))
+        # One search shared by both channels (np.interp would search once per axis)
+        idx = np.searchsorted(t_old, t_new).clip(1, len(t_old) - 1)
+        frac = (t_new - t_old[idx - 1]) / (t_old[idx] - t_old[idx - 1])
+        lo = points[idx - 1]
+        return lo + frac[:, None] * (points[idx] - lo)
 
     def world_to_screen(self, x, y):
         # Rotate around the track centre (if rotation is set), then scale+translate
@@ -766,6 +771,42 @@ class QualifyingReplay(arcade.Window):
         sy = self.world_scale * y + self.ty
         return sx, sy
 
+    def _compute_rotated_bounds(self):
+        """Return (x_min, x_max, y_min, y_max) of the track edges after rotation about the centre."""
+        points = np.concatenate((self.world_inner_arr, self.world_outer_arr))
+        if not len(points):
+            return self.x_min, self.x_max, self.y_min, self.y_max
+        if self._rot_rad:
+            centre = np.array([(self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2], dtype=np.float32)
+            rot = np.array([[self._cos_rot, -self._sin_rot],
+                            [self._sin_rot, self._cos_rot]], dtype=np.float32)
+            points = (points - centre) @ rot.T + centre
+        (x_min, y_min), (x_max, y_max) = points.min(axis=0), points.max(axis=0)
+        return float(x_min), float(x_max), float(y_min), float(y_max)
+
+    def _update_affine(self):
+        """
+        Compose the rotation about the track centre, the scale and the translation
+        into one 2x3 matrix: screen = A[:, :2] @ world + A[:, 2].
+        """
+        world_cx = (self.x_min + self.x_max) / 2
+        world_cy = (self.y_min + self.y_max) / 2
+        k, c, s = self.world_scale, self._cos_rot, self._sin_rot
+        self._affine = np.array([
+            [k * c, -k * s, k * (world_cx - c * world_cx + s * world_cy) + self.tx],
+            [k * s, k * c, k * (world_cy - s * world_cx - c * world_cy) + self.ty],
+        ], dtype=np.float32)
+
+    def world_to_screen_array(self, points, out=None):
+        """
+        Vectorized world_to_screen: maps an (N, 2) array of world points to screen space.
+        If given, out must be a float32 (N, 2) array; it is filled in place and returned.
+        """
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+        out = np.matmul(points, self._affine[:, :2].T, out=out)
+        out += self._affine[:, 2]
+        return out
+
     def _pick_telemetry_value(self, tel: dict, *keys):
         """Return the first value for keys that exists in tel and is not None.
         Preserves falsy-but-valid values like 0.0."""
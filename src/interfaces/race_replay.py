@@ -20,6 +20,9 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 SCREEN_TITLE = "F1 Race Replay"
 PLAYBACK_SPEEDS = [0.1, 0.2, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0, 128.0, 256.0]
+# Bounds on the number of samples per track edge polyline (adapted to the window size)
+TRACK_MIN_POINTS = 200
+TRACK_MAX_POINTS = 2000
 
 class F1RaceReplayWindow(arcade.Window):
     def __init__(self, frames, track_statuses, example_lap, drivers, title,
@@ -100,8 +103,7 @@ class F1RaceReplayWindow(arcade.Window):
         # Build a dense reference polyline (used for projecting car (x,y) -> along-track distance)
         ref_points = self._interpolate_points(self.plot_x_ref, self.plot_y_ref, interp_points=4000)
         # store as numpy arrays for vectorized ops
-        self._ref_xs = np.array([p[0] for p in ref_points])
-        self._ref_ys = np.array([p[1] for p in ref_points])
+        self._ref_xs, self._ref_ys = np.ascontiguousarray(ref_points.T)
 
         # cumulative distances along the reference polyline (metres)
         diffs = np.sqrt(np.diff(self._ref_xs)**2 + np.diff(self._ref_ys)**2)
@@ -109,18 +111,32 @@ class F1RaceReplayWindow(arcade.Window):
         self._ref_cumdist = np.concatenate(([0.0], np.cumsum(diffs)))
         self._ref_total_length = float(self._ref_cumdist[-1]) if len(self._ref_cumdist) > 0 else 0.0
 
-        # Pre-calculate interpolated world points ONCE (optimization)
-        self.world_inner_points = self._interpolate_points(self.x_inner, self.y_inner)
-        self.world_outer_points = self._interpolate_points(self.x_outer, self.y_outer)
+        # Per-frame values that never change after load (race clock strings, standings cache)
+        self._prepare_frames()
+
+        # Pre-calculate interpolated world points at full detail; update_scaling decimates
+        # them to the window size (bounds below are always taken from the full-detail edges)
+        self._track_detail = 0
+        self._set_track_detail(TRACK_MAX_POINTS)
 
         # These will hold the actual screen coordinates to draw
         self.screen_inner_points = []
         self.screen_outer_points = []
+        # Cached GPU geometry for the track edges / DRS zones (rebuilt lazily after a resize)
+        self._track_shapes = None
+        self._track_shapes_color = None
+        self._drs_shapes = None
+        # (frame index, playback speed) the per-frame draw state was last computed for
+        self._drawn_state_key = None
+        self._track_color = (150, 150, 150)
         
         # Scaling parameters (initialized to 0, calculated in update_scaling)
         self.world_scale = 1.0
         self.tx = 0
         self.ty = 0
+        self._last_size = (0, 0)
+        self._rotated_bounds = self._compute_rotated_bounds()
+        self._update_affine()
 
         # Load Background
         bg_path = os.path.join("resources", "background.png")
@@ -133,6 +149,11 @@ class F1RaceReplayWindow(arcade.Window):
         self.time_text = arcade.Text("", 20, self.height - 80, arcade.color.WHITE, 20, anchor_y="top")
         self.status_text = arcade.Text("", 20, self.height - 120, arcade.color.WHITE, 24, bold=True, anchor_y="top")
 
+        # One pre-rendered circle sprite per driver (same order as _driver_codes), drawn as a single batch
+        self.car_sprites = arcade.SpriteList()
+        for color in self._colors:
+            self.car_sprites.append(arcade.SpriteCircle(6, color))
+
         # Trigger initial scaling calculation
         self.update_scaling(self.width, self.height)
 
@@ -141,71 +162,135 @@ class F1RaceReplayWindow(arcade.Window):
         self.leaderboard_rects = []  # list of tuples: (code, left, bottom, right, top)
 
     def _interpolate_points(self, xs, ys, interp_points=2000):
-        t_old = np.linspace(0, 1, len(xs))
+        """Resample the polyline (xs, ys) to interp_points evenly spaced samples; returns an (N, 2) array."""
+        points = np.column_stack((np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)))
+        if len(points) < 2:
+            return np.repeat(points, interp_points, axis=0)
+        t_old = np.linspace(0, 1, len(points))
         t_new = np.linspace(0, 1, interp_points)
-        xs_i = np.interp(t_new, t_old, xs)
-        ys_i = np.interp(t_new, t_old, ys)
-        return list(zip(xs_i, ys_i))
+        # One search shared by both channels (np.interp would search once per axis)
+        idx = np.searchsorted(t_old, t_new).clip(1, len(t_old) - 1)
+        frac = (t_new - t_old[idx - 1]) / (t_old[idx] - t_old[idx - 1])
+        lo = points[idx - 1]
+        return lo + frac[:, None] * (points[idx] - lo)
 
-    def _project_to_reference(self, x, y):
+    def _prepare_frames(self):
+        """
+        One-shot preprocessing of the (immutable) frames. Per-driver values are copied into
+        (n_frames, n_drivers) arrays so drawing reads array rows instead of nested dicts, and
+        the race clock string (a pure function of frame["t"]) is built for every frame.
+        Standings need every car projected onto the reference polyline, which is too costly
+        to run for a whole race at load time, so they are computed the first time a frame is
+        shown and cached.
+        """
+        # Consecutive frames mostly share a whole second, so only format when it ticks over
+        self._frame_time_strs = []
+        last_sec, time_str = None, ""
+        for frame in self.frames:
+            sec = int(frame["t"])
+            if sec != last_sec:
+                last_sec, time_str = sec, self._format_race_time(sec)
+            self._frame_time_strs.append(time_str)
+
+        # Frames always carry the same driver set; array columns follow this order
+        self._driver_codes = list(self.frames[0]["drivers"]) if self.frames else []
+        self._colors = [tuple(self.driver_colors.get(code, arcade.color.WHITE)) for code in self._driver_codes]
+        n_drivers = len(self._driver_codes)
+
+        # Columnar (n_frames, n_drivers) copies of the per-driver values read every frame
+        def column(key, default, dtype):
+            values = (frame["drivers"][code].get(key, default) for frame in self.frames for code in self._driver_codes)
+            return np.fromiter(values, dtype=dtype, count=self.n_frames * n_drivers).reshape(self.n_frames, n_drivers)
+
+        self.xs = column("x", 0.0, np.float32)
+        self.ys = column("y", 0.0, np.float32)
+        self.dist = column("dist", 0.0, np.float64)
+        self.rel_dist = column("rel_dist", 0.0, np.float32)
+        self.lap = column("lap", 1, np.int32)
+        # Drivers still running (rel_dist == 1 marks a driver as OUT)
+        self.active = self.rel_dist != 1
+
+        self._frame_order = np.full((self.n_frames, n_drivers), -1, dtype=np.int16)
+        self._frame_progress = np.zeros((self.n_frames, n_drivers), dtype=np.float64)
+
+    @staticmethod
+    def _format_race_time(t):
+        hours, rem = divmod(int(t), 3600)
+        minutes, seconds = divmod(rem, 60)
+        return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+    def _frame_standings(self, idx):
+        """
+        Return (order, progress) for frame idx: driver indices (into _driver_codes) in
+        leaderboard order, and each driver's progress in metres since the race start.
+        Order is by projected progress during lap 1; once anyone is past lap 1 it is by lap
+        then race distance (ties keep the progress order).
+        """
+        if self._frame_order.shape[1] and self._frame_order[idx, 0] < 0:
+            # progress in metres since race start: (lap-1) * lap_length + projected_m
+            projected_m = self._project_to_reference(self.xs[idx], self.ys[idx])
+            progress = (np.maximum(self.lap[idx], 1) - 1) * self._ref_total_length + projected_m
+            self._frame_progress[idx] = progress
+            order = np.argsort(-progress, kind="stable")
+            laps = self.lap[idx]
+            if (laps > 1).any():
+                order = order[np.lexsort((-self.dist[idx, order], -laps[order]))]
+            self._frame_order[idx] = order
+        return self._frame_order[idx], self._frame_progress[idx]
+
+    def _project_to_reference(self, xs, ys):
+        """Project arrays of car positions onto the reference polyline; returns along-track metres."""
         if self._ref_total_length == 0.0:
-            return 0.0
+            return np.zeros(len(xs))
 
         # Vectorized nearest-point to dense polyline points (sufficient for our purposes)
-        dx = self._ref_xs - x
-        dy = self._ref_ys - y
+        dx = self._ref_xs[None, :] - xs[:, None]
+        dy = self._ref_ys[None, :] - ys[:, None]
         d2 = dx * dx + dy * dy
-        idx = int(np.argmin(d2))
-
-        # For a slightly better estimate, optionally project onto the adjacent segment
-        if idx < len(self._ref_xs) - 1:
-            x1, y1 = self._ref_xs[idx], self._ref_ys[idx]
-            x2, y2 = self._ref_xs[idx+1], self._ref_ys[idx+1]
-            vx, vy = x2 - x1, y2 - y1
-            seg_len2 = vx*vx + vy*vy
-            if seg_len2 > 0:
-                t = ((x - x1) * vx + (y - y1) * vy) / seg_len2
-                t_clamped = max(0.0, min(1.0, t))
-                proj_x = x1 + t_clamped * vx
-                proj_y = y1 + t_clamped * vy
-                # distance along segment from x1,y1
-                seg_dist = np.sqrt((proj_x - x1)**2 + (proj_y - y1)**2)
-                return float(self._ref_cumdist[idx] + seg_dist)
-
-        # Fallback: return the cumulative distance at the closest dense sample
-        return float(self._ref_cumdist[idx])
+        idx = np.argmin(d2, axis=1)
+
+        # For a slightly better estimate, project onto the segment following the closest sample
+        nxt = np.minimum(idx + 1, len(self._ref_xs) - 1)
+        x1, y1 = self._ref_xs[idx], self._ref_ys[idx]
+        vx, vy = self._ref_xs[nxt] - x1, self._ref_ys[nxt] - y1
+        seg_len2 = vx * vx + vy * vy
+        on_segment = seg_len2 > 0  # False for the last sample, which has no following segment
+        safe_len2 = np.where(on_segment, seg_len2, 1.0)
+        t = np.clip(((xs - x1) * vx + (ys - y1) * vy) / safe_len2, 0.0, 1.0)
+        # distance along segment from x1,y1
+        seg_dist = np.where(on_segment, t * np.sqrt(safe_len2), 0.0)
+        return self._ref_cumdist[idx] + seg_dist
+
+    def _set_track_detail(self, n_points):
+        """(Re)interpolate the track edges at n_points samples and size the screen buffers to match."""
+        if n_points == self._track_detail:
+            return
+        self._track_detail = n_points
+        self.world_inner_points = self._interpolate_points(self.x_inner, self.y_inner, interp_points=n_points)
+        self.world_outer_points = self._interpolate_points(self.x_outer, self.y_outer, interp_points=n_points)
+        # Packed (N, 2) float32 copies used by the vectorized world -> screen transform
+        self.world_inner_arr = self.world_inner_points.astype(np.float32)
+        self.world_outer_arr = self.world_outer_points.astype(np.float32)
+        # Preallocated screen-space buffers, refilled in place by update_scaling
+        self._screen_inner = np.empty_like(self.world_inner_arr)
+        self._screen_outer = np.empty_like(self.world_outer_arr)
 
     def update_scaling(self, screen_w, screen_h):
         """
         Recalculates the scale and translation to fit the track 
         perfectly within the new screen dimensions while maintaining aspect ratio.
         """
+        # Resize drags fire many events with the same size; nothing changes for those
+        if (screen_w, screen_h) == self._last_size:
+            return
+        self._last_size = (screen_w, screen_h)
+
         padding = 0.05
-        # If a rotation is applied, we must compute the rotated bounds
         world_cx = (self.x_min + self.x_max) / 2
         world_cy = (self.y_min + self.y_max) / 2
 
-        def _rotate_about_center(x, y):
-            # Translate to centre, rotate, translate back
-            tx = x - world_cx
-            ty = y - world_cy
-            rx = tx * self._cos_rot - ty * self._sin_rot
-            ry = tx * self._sin_rot + ty * self._cos_rot
-            return rx + world_cx, ry + world_cy
-
-        # Build rotated extents from inner/outer world points
-        rotated_points = []
-        for x, y in self.world_inner_points:
-            rotated_points.append(_rotate_about_center(x, y))
-        for x, y in self.world_outer_points:
-            rotated_points.append(_rotate_about_center(x, y))
-
-        xs = [p[0] for p in rotated_points]
-        ys = [p[1] for p in rotated_points]
-        world_x_min = min(xs) if xs else self.x_min
-        world_x_max = max(xs) if xs else self.x_max
-        world_y_min = min(ys) if ys else self.y_min
-        world_y_max = max(ys) if ys else self.y_max
+        # Rotated extents don't depend on the window size (computed once in __init__)
+        world_x_min, world_x_max, world_y_min, world_y_max = self._rotated_bounds
 
         world_w = max(1.0, world_x_max - world_x_min)
         world_h = max(1.0, world_y_max - world_y_min)
@@ -229,10 +314,47 @@ class F1RaceReplayWindow(arcade.Window):
 
         self.tx = screen_cx - self.world_scale * world_cx
         self.ty = screen_cy - self.world_scale * world_cy
-
-        # Update the polyline screen coordinates based on new scale
-        self.screen_inner_points = [self.world_to_screen(x, y) for x, y in self.world_inner_points]
-        self.screen_outer_points = [self.world_to_screen(x, y) for x, y in self.world_outer_points]
+        self._update_affine()
+
+        # Level of detail: about one edge sample per 2 screen pixels of track length,
+        # so small windows don't upload and draw thousands of sub-pixel segments
+        screen_track_len = self.world_scale * self._ref_total_length
+        self._set_track_detail(min(TRACK_MAX_POINTS, max(TRACK_MIN_POINTS, int(screen_track_len / 2))))
+
+        # Update the polyline screen coordinates based on new scale (transformed in place, no allocations)
+        self.screen_inner_points = self.world_to_screen_array(self.world_inner_arr, out=self._screen_inner)
+        self.screen_outer_points = self.world_to_screen_array(self.world_outer_arr, out=self._screen_outer)
+
+        # Screen position of every car in every frame under this transform; drawing just reads a row
+        (a00, a01, a02), (a10, a11, a12) = self._affine.tolist()
+        self.screen_xs = self.xs * a00 + self.ys * a01 + a02
+        self.screen_ys = self.xs * a10 + self.ys * a11 + a12
+
+        # Screen geometry changed: cached shape lists and car positions are rebuilt on the next draw
+        self._track_shapes = None
+        self._drs_shapes = None
+        self._drawn_state_key = None
+
+    def _build_track_shapes(self, track_color):
+        """Upload both track edges to the GPU once as a single ShapeElementList."""
+        self._track_shapes = arcade.shape_list.ShapeElementList()
+        for points in (self.screen_inner_points, self.screen_outer_points):
+            if len(points) > 1:
+                self._track_shapes.append(arcade.shape_list.create_line_strip(points, track_color, 4))
+        self._track_shapes_color = track_color
+
+    def _build_drs_shapes(self):
+        """Upload the DRS zone segments (on the outer track edge) as a single ShapeElementList."""
+        self._drs_shapes = arcade.shape_list.ShapeElementList()
+        drs_color = (0, 255, 0)  # Bright green for DRS zones
+        x_outer, y_outer = np.asarray(self.x_outer), np.asarray(self.y_outer)
+        for zone in self.drs_zones or []:
+            start_idx = zone["start"]["index"]
+            end_idx = zone["end"]["index"] + 1
+            world_pts = np.column_stack((x_outer[start_idx:end_idx], y_outer[start_idx:end_idx]))
+            drs_outer_points = list(map(tuple, self.world_to_screen_array(world_pts).tolist()))
+            if len(drs_outer_points) > 1:
+                self._drs_shapes.append(arcade.shape_list.create_line_strip(drs_outer_points, drs_color, 6))
 
     def on_resize(self, width, height):
         """Called automatically by Arcade when window is resized."""
@@ -267,6 +389,42 @@ class F1RaceReplayWindow(arcade.Window):
         sy = self.world_scale * y + self.ty
         return sx, sy
 
+    def _compute_rotated_bounds(self):
+        """Return (x_min, x_max, y_min, y_max) of the track edges after rotation about the centre."""
+        points = np.concatenate((self.world_inner_arr, self.world_outer_arr))
+        if not len(points):
+            return self.x_min, self.x_max, self.y_min, self.y_max
+        if self._rot_rad:
+            centre = np.array([(self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2], dtype=np.float32)
+            rot = np.array([[self._cos_rot, -self._sin_rot],
+                            [self._sin_rot, self._cos_rot]], dtype=np.float32)
+            points = (points - centre) @ rot.T + centre
+        (x_min, y_min), (x_max, y_max) = points.min(axis=0), points.max(axis=0)
+        return float(x_min), float(x_max), float(y_min), float(y_max)
+
+    def _update_affine(self):
+        """
+        Compose the rotation about the track centre, the scale and the translation
+        into one 2x3 matrix: screen = A[:, :2] @ world + A[:, 2].
+        """
+        world_cx = (self.x_min + self.x_max) / 2
+        world_cy = (self.y_min + self.y_max) / 2
+        k, c, s = self.world_scale, self._cos_rot, self._sin_rot
+        self._affine = np.array([
+            [k * c, -k * s, k * (world_cx - c * world_cx + s * world_cy) + self.tx],
+            [k * s, k * c, k * (world_cy - s * world_cx - c * world_cy) + self.ty],
+        ], dtype=np.float32)
+
+    def world_to_screen_array(self, points, out=None):
+        """
+        Vectorized world_to_screen: maps an (N, 2) array of world points to screen space.
+        If given, out must be a float32 (N, 2) array; it is filled in place and returned.
+        """
+        points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+        out = np.matmul(points, self._affine[:, :2].T, out=out)
+        out += self._affine[:, 2]
+        return out
+
     def _format_wind_direction(self, degrees):
         if degrees is None:
             return "N/A"
@@ -278,19 +436,8 @@ class F1RaceReplayWindow(arcade.Window):
         idx = int((deg_norm / 22.5) + 0.5) % len(dirs)
         return dirs[idx]
 
-    def on_draw(self):
-        self.clear()
-
-        # 1. Draw Background (stretched to fit new window size)
-        if self.bg_texture:
-            arcade.draw_lrbt_rectangle_textured(
-                left=0, right=self.width,
-                bottom=0, top=self.height,
-                texture=self.bg_texture
-            )
-
-        # 2. Draw Track (using pre-calculated screen points)
-        idx = min(int(self.frame_index), self.n_frames - 1)
+    def _update_frame_state(self, idx):
+        """Recompute everything drawn that depends on frame idx (called only when the frame changes)."""
         frame = self.frames[idx]
         current_time = frame["t"]
         current_track_status = "GREEN"
@@ -317,82 +464,35 @@ class F1RaceReplayWindow(arcade.Window):
             track_color = STATUS_COLORS.get("RED")
         elif current_track_status == "6" or current_track_status == "7":
             track_color = STATUS_COLORS.get("VSC")
-            
-        if len(self.screen_inner_points) > 1:
-            arcade.draw_line_strip(self.screen_inner_points, track_color, 4)
-        if len(self.screen_outer_points) > 1:
-            arcade.draw_line_strip(self.screen_outer_points, track_color, 4)
-        
-        # 2.5 Draw DRS Zones (green segments on outer track edge)
-        if hasattr(self, 'drs_zones') and self.drs_zones and self.toggle_drs_zones:
-            drs_color = (0, 255, 0)  # Bright green for DRS zones
-            
-            for _, zone in enumerate(self.drs_zones):
-                start_idx = zone["start"]["index"]
-                end_idx = zone["end"]["index"]
-                
-                # Extract the outer track points for this DRS zone segment
-                drs_outer_points = []
-                for i in range(start_idx, min(end_idx + 1, len(self.x_outer))):
-                    x = self.x_outer.iloc[i]
-                    y = self.y_outer.iloc[i]
-                    sx, sy = self.world_to_screen(x, y)
-                    drs_outer_points.append((sx, sy))
-                
-                # Draw the DRS zone segment
-                if len(drs_outer_points) > 1:
-                    arcade.draw_line_strip(drs_outer_points, drs_color, 6)
-
-        draw_finish_line(self)
-        # 3. Draw Cars
-        frame = self.frames[idx]
-        for code, pos in frame["drivers"].items():
-            sx, sy = self.world_to_screen(pos["x"], pos["y"])
-            color = self.driver_colors.get(code, arcade.color.WHITE)
-            arcade.draw_circle_filled(sx, sy, 6, color)
-        
-        # --- UI ELEMENTS (Dynamic Positioning) ---
-        
-        # Determine Leader info using projected along-track distance (more robust than dist)
-        # Use the progress metric in metres for each driver and use that to order the leaderboard.
-        driver_progress = {}
-        for code, pos in frame["drivers"].items():
-            # parse lap defensively
-            lap_raw = pos.get("lap", 1)
-            try:
-                lap = int(lap_raw)
-            except Exception:
-                lap = 1
-
-            # Project (x,y) to reference and combine with lap count
-            projected_m = self._project_to_reference(pos.get("x", 0.0), pos.get("y", 0.0))
-
-            # progress in metres since race start: (lap-1) * lap_length + projected_m
-            progress_m = float((max(lap, 1) - 1) * self._ref_total_length + projected_m)
-
-            driver_progress[code] = progress_m
-
-        # Leader is the one with greatest progress_m
-        if driver_progress:
-            leader_code = max(driver_progress, key=lambda c: driver_progress[c])
+        self._track_color = track_color
+
+        # Car positions (drivers marked OUT are hidden rather than drawn on track)
+        active = self.active[idx]
+        screen_pos = zip(self.screen_xs[idx].tolist(), self.screen_ys[idx].tolist())
+        for sprite, (sx, sy), is_active in zip(self.car_sprites, screen_pos, active.tolist()):
+            sprite.visible = is_active
+            sprite.position = (sx, sy)
+
+        # Determine Leader info using projected along-track distance (more robust than dist).
+        # Standings are cached per frame, so revisiting a frame is a lookup.
+        order, progress = self._frame_standings(idx)
+
+        # Leader heads the standings
+        if len(order):
+            leader_code = self._driver_codes[order[0]]
             leader_lap = frame["drivers"][leader_code].get("lap", 1)
         else:
             leader_code = None
             leader_lap = 1
 
-        # Time Calculation
-        t = frame["t"]
-        hours = int(t // 3600)
-        minutes = int((t % 3600) // 60)
-        seconds = int(t % 60)
-        time_str = f"{hours:02}:{minutes:02}:{seconds:02}"
+        time_str = self._frame_time_strs[idx]
 
         # Format Lap String 
         lap_str = f"Lap: {leader_lap}"
         if self.total_laps is not None:
             lap_str += f"/{self.total_laps}"
 
-        # Draw HUD - Top Left
+        # HUD - Top Left
         if self.visible_hud:
             self.lap_text.text = lap_str
             self.time_text.text = f"Race Time: {time_str} (x{self.playback_speed})"
@@ -412,26 +512,65 @@ class F1RaceReplayWindow(arcade.Window):
                 self.status_text.text = "SAFETY CAR"
                 self.status_text.color = arcade.color.BROWN
 
+        self.weather_comp.set_info(frame.get("weather") if frame else None)
+
+        # Leaderboard entries, gathered straight from the per-driver arrays in standings order
+        codes, colors, drivers = self._driver_codes, self._colors, frame["drivers"]
+        driver_list = [
+            (codes[i], colors[i], drivers[codes[i]], progress_m)
+            for i, progress_m in zip(order.tolist(), progress[order].tolist())
+        ]
+        self.leaderboard_comp.set_entries(driver_list, active=active[order].tolist())
+
+    def on_draw(self):
+        self.clear()
+
+        # 1. Draw Background (stretched to fit new window size)
+        if self.bg_texture:
+            arcade.draw_lrbt_rectangle_textured(
+                left=0, right=self.width,
+                bottom=0, top=self.height,
+                texture=self.bg_texture
+            )
+
+        # Per-frame state (track status, car positions, HUD strings, standings) only changes
+        # with the frame (or the playback speed shown in the HUD); paused redraws reuse it
+        idx = min(int(self.frame_index), self.n_frames - 1)
+        if (idx, self.playback_speed) != self._drawn_state_key:
+            self._update_frame_state(idx)
+            self._drawn_state_key = (idx, self.playback_speed)
+
+        # 2. Draw Track (using pre-calculated screen points)
+        # Track edges are static in screen space between resizes / status changes
+        if self._track_shapes is None or self._track_shapes_color != self._track_color:
+            self._build_track_shapes(self._track_color)
+        self._track_shapes.draw()
+        
+        # 2.5 Draw DRS Zones (green segments on outer track edge)
+        if hasattr(self, 'drs_zones') and self.drs_zones and self.toggle_drs_zones:
+            if self._drs_shapes is None:
+                self._build_drs_shapes()
+            self._drs_shapes.draw()
+
+        draw_finish_line(self)
+        # 3. Draw Cars
+        self.car_sprites.draw()
+        
+        # --- UI ELEMENTS (Dynamic Positioning) ---
+
+        # Draw HUD - Top Left
+        if self.visible_hud:
             self.lap_text.draw()
             self.time_text.draw()
             if self.status_text.text:
                 self.status_text.draw()
 
-        # Weather component (set info then draw)
-        weather_info = frame.get("weather") if frame else None
-        self.weather_comp.set_info(weather_info)
+        # Weather component (info is set per frame in _update_frame_state)
         self.weather_comp.draw(self)
         # optionally expose weather_bottom for driver info layout
-        self.weather_bottom = self.height - 170 - 130 if (weather_info or self.has_weather) else None
+        self.weather_bottom = self.height - 170 - 130 if (self.weather_comp.info or self.has_weather) else None
 
         # Draw leaderboard via component
-        driver_list = []
-        for code, pos in frame["drivers"].items():
-            color = self.driver_colors.get(code, arcade.color.WHITE)
-            progress_m = driver_progress.get(code, float(pos.get("dist", 0.0)))
-            driver_list.append((code, color, pos, progress_m))
-        driver_list.sort(key=lambda x: x[3], reverse=True)
-        self.leaderboard_comp.set_entries(driver_list)
         self.leaderboard_comp.draw(self)
         # expose rects for existing hit test compatibility if needed
         self.leaderboard_rects = self.leaderboard_comp.rects
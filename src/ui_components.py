@@ -16,6 +16,12 @@ def _format_wind_direction(degrees: Optional[float]) -> str:
   idx = int((deg_norm / 22.5) + 0.5) % len(dirs)
   return dirs[idx]
 
+def _set_text_color(text: arcade.Text, color) -> None:
+  # Text.color has no "unchanged" short-circuit (unlike .text/.x/.y), so only assign on change
+  color = arcade.types.Color.from_iterable(color)
+  if text.color != color:
+      text.color = color
+
 class BaseComponent:
     def on_resize(self, window): pass
     def draw(self, window): pass
@@ -38,7 +44,7 @@ class LegendComponent(BaseComponent):
         self.lines = ["Help (Click or 'H')"]
         
         self.controls_text_offset = 180
-        self._text = arcade.Text("", 0, 0, arcade.color.CYAN, 14)
+        self._texts = {}  # cached arcade.Text per (line index, bracket index or None)
     
     @property
     def visible(self) -> bool:
@@ -67,7 +73,8 @@ class LegendComponent(BaseComponent):
         line_x = self.x
         line_y = self.y - getattr(self, "controls_text_offset", 0)
         left = line_x
-        text_width = self._text.content_width or 120
+        help_text = self._texts.get((0, None))
+        text_width = (help_text.content_width if help_text else 0) or 120
         right = line_x + text_width + 8
         top = line_y + 8
         bottom = line_y - 18
@@ -119,23 +126,29 @@ class LegendComponent(BaseComponent):
                         
             if brackets:
                 for j in range(len(brackets)):
-                    self._text.font_size = 14
-                    self._text.bold = (i == 0)
-                    self._text.color = arcade.color.LIGHT_GRAY
-                    self._text.text = brackets[j]
-                    self._text.x = self.x + (j * (icon_size + 5))
-                    self._text.y = self.y - (i * 25)
-                    self._text.draw()
+                    self._cached_text((i, j), brackets[j],
+                                      self.x + (j * (icon_size + 5)), self.y - (i * 25),
+                                      arcade.color.LIGHT_GRAY, bold=(i == 0)).draw()
             
             # Draw the text line
-            self._text.text = line
-            self._text.x = self.x + (60 if icon_keys else 0)
             base_y = self.y - (i * 25)
             
             if i == 0:
                 base_y -= getattr(self, "controls_text_offset", 0)
-            self._text.y = base_y
-            self._text.draw()
+            self._cached_text((i, None), line, self.x + (60 if icon_keys else 0), base_y,
+                              arcade.color.CYAN).draw()
+
+    def _cached_text(self, key, text, x, y, color, bold=False):
+        # Reuse one arcade.Text per legend slot so glyphs are only laid out when the content changes
+        label = self._texts.get(key)
+        if label is None:
+            label = arcade.Text(text, x, y, color, 14, bold=bold)
+            self._texts[key] = label
+        else:
+            label.text = text
+            label.x = x
+            label.y = y
+        return label
 
 class WeatherComponent(BaseComponent):
     def __init__(self, left=20, width=280, height=130, top_offset=170, visible=True):
@@ -155,7 +168,8 @@ class WeatherComponent(BaseComponent):
                     texture_path = os.path.join(weather_folder, filename)
                     self._weather_icon_textures[texture_name] = arcade.load_texture(texture_path)
 
-        self._text = arcade.Text("", self.left + 12, 0, arcade.color.LIGHT_GRAY, 14, anchor_y="top")
+        self._title_text = arcade.Text("Weather", self.left + 12, 0, arcade.color.WHITE, 18, bold=True, anchor_y="top")
+        self._line_texts = []  # one arcade.Text per weather line, created on first draw
 
     def set_info(self, info: Optional[dict]):
         self.info = info
@@ -188,7 +202,6 @@ class WeatherComponent(BaseComponent):
         panel_top = window.height - self.top_offset
         if not self.info and not getattr(window, "has_weather", False):
             return
-        arcade.Text("Weather", self.left + 12, panel_top - 10, arcade.color.WHITE, 18, bold=True, anchor_y="top").draw()
         def _fmt(val, suffix="", precision=1):
             return f"{val:.{precision}f}{suffix}" if val is not None else "N/A"
         info = self.info or {}
@@ -204,10 +217,11 @@ class WeatherComponent(BaseComponent):
         start_y = panel_top - 36
         last_y = start_y
 
-        self._text.font_size = 18; self._text.bold = True; self._text.color = arcade.color.WHITE
-        self._text.text = "Weather"
-        self._text.x = self.left + 12; self._text.y = panel_top - 10
-        self._text.draw()
+        self._title_text.x = self.left + 12; self._title_text.y = panel_top - 10
+        self._title_text.draw()
+
+        while len(self._line_texts) < len(weather_lines):
+            self._line_texts.append(arcade.Text("", 0, 0, arcade.color.LIGHT_GRAY, 14, anchor_y="top"))
 
         for idx, (label, value, icon_key) in enumerate(weather_lines):
             line_y = start_y - idx * 22
@@ -228,12 +242,10 @@ class WeatherComponent(BaseComponent):
             
             # Draw text
 
-            line_text = f"{label}: {value}"
-            
-            self._text.font_size = 14; self._text.bold = False; self._text.color = arcade.color.LIGHT_GRAY
-            self._text.text = line_text
-            self._text.x = self.left + 38; self._text.y = line_y
-            self._text.draw()
+            line_text = self._line_texts[idx]
+            line_text.text = f"{label}: {value}"
+            line_text.x = self.left + 38; line_text.y = line_y
+            line_text.draw()
 
         # Track the bottom of the weather panel so info boxes can stack below it
         window.weather_bottom = last_y - 20
@@ -242,12 +254,20 @@ class LeaderboardComponent(BaseComponent):
     def __init__(self, x: int, right_margin: int = 260, width: int = 240, visible=True):
         self.x = x
         self.width = width
-        self.entries = []  # list of tuples (code, color, pos, progress_m)
+        self.entries = []  # list of tuples (code, color, pos, progress_m), already in display order
+        self.active = None  # optional per-entry "still running" flags
         self.rects = []    # clickable rects per entry
         self.selected = []  # Changed to list for multiple selection
         self.row_height = 25
         self._tyre_textures = {}
         self._visible: bool = visible
+        # Persistent text objects; rows are keyed by driver code and only re-laid out when their label changes
+        self._title_text = arcade.Text("Leaderboard", self.x, 0, arcade.color.WHITE, 20, bold=True, anchor_x="left", anchor_y="top")
+        self._row_texts = {}
+        self._lap1_note_text = arcade.Text("May be inaccurate during Lap 1", self.x, 0, arcade.color.YELLOW, 12, anchor_x="left", anchor_y="top")
+        # DRS indicator dots: one circle sprite per driver code, all drawn in a single batch
+        self._drs_dots = arcade.SpriteList()
+        self._drs_dot_by_code = {}
         # Import the tyre textures from the images/tyres folder (all files)
         tyres_folder = os.path.join("images", "tyres")
         if os.path.exists(tyres_folder):
@@ -278,31 +298,27 @@ class LeaderboardComponent(BaseComponent):
         """
         self._visible = True
 
-    def set_entries(self, entries: List[Tuple[str, Tuple[int,int,int], dict, float]]):
-        # entries sorted as expected
+    def set_entries(self, entries: List[Tuple[str, Tuple[int,int,int], dict, float]], active: Optional[List[bool]] = None):
+        # entries sorted as expected; active (optional, aligned with entries) flags drivers still running,
+        # otherwise it is derived from each entry's rel_dist
         self.entries = entries
+        self.active = active
     def draw(self, window):
         # Skip rendering entirely if hidden
         if not self._visible:
             return
         self.selected = getattr(window, "selected_drivers", [])
         leaderboard_y = window.height - 40
-        arcade.Text("Leaderboard", self.x, leaderboard_y, arcade.color.WHITE, 20, bold=True, anchor_x="left", anchor_y="top").draw()
+        self._title_text.x = self.x
+        self._title_text.y = leaderboard_y
+        self._title_text.draw()
         self.rects = []
+        drawn_drs_dots = set()
 
-        # Sort entries by lap number an distance progressed
-        # If any of the entries have lap > 1, then sort
-
-        if any(e[2].get("lap", 0) > 1 for e in self.entries):
-            new_entries = sorted(
-                self.entries,
-                key=lambda e: (
-                    -e[2].get("lap", 0),  # Descending lap number
-                    -e[2].get("dist")                 # Descending distance progressed
-                )
-            )
-        else:
-            new_entries = self.entries
+        # Entries arrive in display order: the window sorts them by progress during lap 1,
+        # then by lap number and distance progressed (vectorized over its per-frame arrays)
+        new_entries = self.entries
+        active = self.active if self.active is not None else [pos.get("rel_dist", 0) != 1 for _, _, pos, _ in new_entries]
 
         for i, (code, color, pos, progress_m) in enumerate(new_entries):
             current_pos = i + 1
@@ -318,8 +334,17 @@ class LeaderboardComponent(BaseComponent):
                 text_color = arcade.color.BLACK
             else:
                 text_color = color
-            text = f"{current_pos}. {code}" if pos.get("rel_dist",0) != 1 else f"{current_pos}. {code}   OUT"
-            arcade.Text(text, left_x, top_y, text_color, 16, anchor_x="left", anchor_y="top").draw()
+            text = f"{current_pos}. {code}" if active[i] else f"{current_pos}. {code}   OUT"
+            row_text = self._row_texts.get(code)
+            if row_text is None:
+                row_text = arcade.Text(text, left_x, top_y, text_color, 16, anchor_x="left", anchor_y="top")
+                self._row_texts[code] = row_text
+            else:
+                row_text.text = text
+                row_text.x = left_x
+                row_text.y = top_y
+                _set_text_color(row_text, text_color)
+            row_text.draw()
 
              # Tyre Icons
             tyre_texture = self._tyre_textures.get(str(pos.get("tyre", "?")).upper())
@@ -350,13 +375,24 @@ class LeaderboardComponent(BaseComponent):
                 drs_dot_x = tyre_icon_x - icon_size - 4 
                 drs_dot_y = tyre_icon_y
 
-                arcade.draw_circle_filled(drs_dot_x, drs_dot_y, 4, drs_color)
+                drs_dot = self._drs_dot_by_code.get(code)
+                if drs_dot is None:
+                    drs_dot = arcade.SpriteCircle(4, drs_color)
+                    self._drs_dot_by_code[code] = drs_dot
+                    self._drs_dots.append(drs_dot)
+                drs_dot.color = drs_color
+                drs_dot.position = (drs_dot_x, drs_dot_y)
+                drawn_drs_dots.add(code)
+
+        for code, drs_dot in self._drs_dot_by_code.items():
+            drs_dot.visible = code in drawn_drs_dots
+        self._drs_dots.draw()
 
         # Add text at the bottom of the leaderboard during lap 1 to alert the user to potential mis-ordering
         if new_entries[0][2].get("lap", 0) == 1:
-            arcade.Text("May be inaccurate during Lap 1",
-                        self.x, leaderboard_y - 30 - (len(new_entries) * self.row_height) - 20,
-                        arcade.color.YELLOW, 12, anchor_x="left", anchor_y="top").draw()
+            self._lap1_note_text.x = self.x
+            self._lap1_note_text.y = leaderboard_y - 30 - (len(new_entries) * self.row_height) - 20
+            self._lap1_note_text.draw()
 
     def on_mouse_press(self, window, x: float, y: float, button: int, modifiers: int):
         for code, left, bottom, right, top in self.rects:
@@ -1669,31 +1705,39 @@ def extract_race_events(frames: List[dict], track_statuses: List[dict], total_la
 # Build track geometry from example lap telemetry
 def build_track_from_example_lap(example_lap, track_width=200):
     drs_zones = plotDRSzones(example_lap)
-    plot_x_ref = example_lap["X"]
-    plot_y_ref = example_lap["Y"]
-
-    # compute tangents
-    dx = np.gradient(plot_x_ref)
-    dy = np.gradient(plot_y_ref)
-
-    norm = np.sqrt(dx**2 + dy**2)
-    norm[norm == 0] = 1.0
-    dx /= norm
-    dy /= norm
-
-    nx = -dy
-    ny = dx
-
-    x_outer = plot_x_ref + nx * (track_width / 2)
-    y_outer = plot_y_ref + ny * (track_width / 2)
-    x_inner = plot_x_ref - nx * (track_width / 2)
-    y_inner = plot_y_ref - ny * (track_width / 2)
-
-    # world bounds
-    x_min = min(plot_x_ref.min(), x_inner.min(), x_outer.min())
-    x_max = max(plot_x_ref.max(), x_inner.max(), x_outer.max())
-    y_min = min(plot_y_ref.min(), y_inner.min(), y_outer.min())
-    y_max = max(plot_y_ref.max(), y_inner.max(), y_outer.max())
+    # Pack the reference line into one (N, 2) array so both axes go through each step together.
+    # float32 is plenty for screen rendering (F1 coordinates span ~1e4 with ~7 significant digits)
+    ref = np.column_stack((example_lap["X"].to_numpy(dtype=np.float32),
+                           example_lap["Y"].to_numpy(dtype=np.float32)))
+    plot_x_ref, plot_y_ref = ref[:, 0], ref[:, 1]
+
+    # compute tangents: central differences inside, one-sided at the ends (same as np.gradient,
+    # without its generic dispatch and temporaries)
+    tangent = np.empty_like(ref)
+    np.subtract(ref[2:], ref[:-2], out=tangent[1:-1])
+    tangent[1:-1] *= 0.5
+    tangent[0] = ref[1] - ref[0]
+    tangent[-1] = ref[-1] - ref[-2]
+    # Normalisation runs in place on one buffer (norm -> clamp -> reciprocal), no temporaries
+    inv_half = np.hypot(tangent[:, 0], tangent[:, 1])
+    np.maximum(inv_half, 1e-12, out=inv_half)
+    # Half the track width folded into one reciprocal: a single divide per sample, multiplies after
+    np.divide(track_width * 0.5, inv_half, out=inv_half)
+
+    # normal (nx, ny) = (-dy, dx) scaled to half the track width, offsets both edges
+    offset = np.empty_like(ref)
+    np.multiply(tangent[:, 1], inv_half, out=offset[:, 0])
+    np.negative(offset[:, 0], out=offset[:, 0])
+    np.multiply(tangent[:, 0], inv_half, out=offset[:, 1])
+    outer = ref + offset
+    inner = ref - offset
+    x_outer, y_outer = outer[:, 0], outer[:, 1]
+    x_inner, y_inner = inner[:, 0], inner[:, 1]
+
+    # world bounds (as Python floats so scale/translation maths stays in double precision)
+    # reference line and both edges stacked as (3N, 2): one column-wise min and max cover them all
+    all_points = np.concatenate((ref, inner, outer))
+    (x_min, y_min), (x_max, y_max) = all_points.min(axis=0).tolist(), all_points.max(axis=0).tolist()
 
     return (plot_x_ref, plot_y_ref, x_inner, y_inner, x_outer, y_outer,
             x_min, x_max, y_min, y_max, drs_zones)
@@ -1747,8 +1791,8 @@ def draw_finish_line(self, session_type = 'R'):
     else:
         return
     
-    # Draw checkered finish line
-    if start_inner and start_outer:
+    # Draw checkered finish line (points may be tuples or rows of a NumPy array)
+    if start_inner is not None and start_outer is not None:
         num_squares = 20
         extension = 20
             